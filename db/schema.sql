@@ -62,7 +62,7 @@ CREATE TABLE IF NOT EXISTS dealer (
 -- Deregistration Table
 DROP TABLE IF EXISTS dereg;
 CREATE TABLE IF NOT EXISTS dereg (
-    "N-NUMBER" TEXT,
+    "N-NUMBER" TEXT PRIMARY KEY,
     "SERIAL-NUMBER" TEXT,
     "MFR-MDL-CODE" TEXT,
     "STATUS-CODE" TEXT,
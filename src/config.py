@@ -20,15 +20,22 @@ CONFIG = {
     # Local path where the downloaded ZIP file will be saved
     "ZIP_PATH": os.path.join(ROOT, "data", "ReleasableAircraft.zip"),
     
+    # Directory the ZIP members are extracted to when --extract is used
+    "EXTRACT_DIR": os.path.join(ROOT, "data", "extracted"),
+    
     # Path to the SQLite database file that will store the imported data
     "DB_PATH": os.path.join(ROOT, "db", "faa_registry.db"),
     
     # Path to the SQL schema file used to create the database structure
     "SCHEMA_PATH": os.path.join(ROOT, "db", "schema.sql"),
     
+    # Buffer size in bytes for streaming the download to disk and for reading
+    # each data file out of the ZIP (1 MB keeps inflate and decode in big chunks)
+    "IO_BUFFER_SIZE": 1 << 20,
+    
     # Table definitions: maps table names to their column lists
     # The column order must match the order in the FAA's CSV files
-    # The first column in each list is treated as the primary key for duplicate detection
+    # Rows with an empty first column are skipped; duplicates are detected by the table's primary key
     "TABLES": {
         # ACFTREF: Aircraft Reference table - contains aircraft model specifications
         # Includes manufacturer, model codes, engine type, category, weight, and certification data
@@ -18,6 +18,16 @@ TYPE_MAP = {
     "DATE": "DATE"             # DATE type is compatible in both systems
 }
 
+# Patterns used by convert_schema, compiled once at import time.
+# _STATEMENT_RE finds every DROP TABLE and whole CREATE TABLE block (up to the
+# ");" line that closes it) in a single sweep over the script.
+_STATEMENT_RE = re.compile(
+    r'^[ \t]*DROP TABLE IF EXISTS\s+"?(?P<drop>\w+)"?;'
+    r'|^[ \t]*CREATE TABLE IF NOT EXISTS\s+"?(?P<create>\w+)"?(?P<body>.*?)^[ \t]*\);[ \t]*$',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+_COL_RE = re.compile(r'"(.+?)"\s+(\w+)(.*)')
+
 def convert_type(sqlite_type, is_key=False):
     """
     Convert a SQLite data type to its SQL Server equivalent.
@@ -45,55 +55,40 @@ def convert_schema(sqlite_sql):
     """
     Convert a complete SQLite schema SQL script to SQL Server T-SQL format.
     
-    This function processes SQLite DDL statements line by line and converts them
-    to SQL Server compatible syntax. It handles:
+    This function finds every DROP TABLE and CREATE TABLE statement with one
+    regular expression sweep over the script and converts each to SQL Server
+    compatible syntax. It handles:
     - DROP TABLE statements (IF EXISTS -> IF OBJECT_ID)
     - CREATE TABLE statements (IF NOT EXISTS -> conditional check)
     - Column definitions (type conversion and bracket quoting)
     - Trailing comma removal before closing parenthesis
     
+    Anything outside those statements (comments, blank lines) is dropped.
+    
     Args:
         sqlite_sql (str): Complete SQLite schema as a multi-line string
     
     Returns:
         str: SQL Server compatible T-SQL schema script
     """
-    output_lines = []           # Accumulated output lines for the converted schema
-    lines = sqlite_sql.splitlines()  # Split input into individual lines
-    inside_create = False       # Flag to track if we're inside a CREATE TABLE block
-    table_name = ""             # Current table being processed
+    output_lines = []  # Accumulated output lines for the converted schema
 
-    # Process each line of the input SQL
-    for line in lines:
-        stripped = line.strip()
-        
-        # Convert SQLite's "DROP TABLE IF EXISTS" to SQL Server's IF OBJECT_ID pattern
-        if stripped.upper().startswith("DROP TABLE IF EXISTS"):
-            # Extract table name from the DROP statement
-            table = re.findall(r"DROP TABLE IF EXISTS\s+\"?(\w+)\"?;", stripped, re.IGNORECASE)
-            if table:
-                # SQL Server checks for object existence using OBJECT_ID
-                # 'U' parameter specifies user tables
-                output_lines.append(f"IF OBJECT_ID('{table[0]}', 'U') IS NOT NULL DROP TABLE [{table[0]}];")
-            continue
-        # Convert SQLite's "CREATE TABLE IF NOT EXISTS" to SQL Server syntax
-        if stripped.upper().startswith("CREATE TABLE IF NOT EXISTS"):
-            # Extract the table name from the CREATE statement
-            table_name = re.findall(r"CREATE TABLE IF NOT EXISTS\s+\"?(\w+)\"?", stripped, re.IGNORECASE)[0]
-            # SQL Server uses square brackets for identifiers instead of double quotes
-            output_lines.append(f"CREATE TABLE [{table_name}] (")
-            inside_create = True  # Mark that we're now processing column definitions
+    for statement in _STATEMENT_RE.finditer(sqlite_sql):
+        table = statement.group("drop")
+        if table:
+            # SQL Server checks for object existence using OBJECT_ID
+            # 'U' parameter specifies user tables
+            output_lines.append(f"IF OBJECT_ID('{table}', 'U') IS NOT NULL DROP TABLE [{table}];")
             continue
-        # Process lines inside a CREATE TABLE statement
-        if inside_create:
-            # Check for the closing parenthesis that ends the table definition
-            if stripped == ");":
-                output_lines.append(");")
-                inside_create = False  # Exit the CREATE TABLE block
-                continue
-            
+
+        # SQL Server uses square brackets for identifiers instead of double quotes
+        output_lines.append(f"CREATE TABLE [{statement.group('create')}] (")
+        # The first body line is the rest of the CREATE line (the opening
+        # parenthesis); column definitions follow one per line
+        for line in statement.group("body").splitlines()[1:]:
+            stripped = line.strip()
             # Parse column definitions: "column_name" TYPE [constraints]
-            col_match = re.match(r'"(.+?)"\s+(\w+)(.*)', stripped.rstrip(","))
+            col_match = _COL_RE.match(stripped.rstrip(","))
             if col_match:
                 col_name, col_type, extras = col_match.groups()
                 # Check if this column is a primary key to optimize type selection
@@ -105,13 +100,9 @@ def convert_schema(sqlite_sql):
             else:
                 # Handle any other lines within CREATE TABLE (constraints, etc.)
                 output_lines.append("    " + stripped)
-
-    # Post-processing: Remove trailing commas before closing parentheses
-    # SQL Server doesn't allow a comma after the last column definition
-    for i in range(len(output_lines) - 1):
-        if output_lines[i].strip().endswith(",") and output_lines[i + 1].strip() == ");":
-            # Remove the trailing comma from the last column
-            output_lines[i] = output_lines[i].rstrip(",")
+        # SQL Server doesn't allow a comma after the last column definition
+        output_lines[-1] = output_lines[-1].rstrip(",")
+        output_lines.append(");")
 
     # Join all lines back into a single string with newlines
-    return "\n".join(output_lines)
\ No newline at end of file
+    return "\n".join(output_lines)
@@ -9,16 +9,11 @@ Supported engines:
 - SQL Server: Enterprise database with optional Windows authentication
 """
 
-import sqlite3  # Built-in SQLite database driver
 from urllib.parse import quote_plus  # URL-encode passwords with special characters
 
-# pyodbc is optional - only needed for SQL Server connections
-# Gracefully handle missing dependency with None fallback
-try:
-    import pyodbc
-except ImportError:
-    pyodbc = None  # Will trigger informative error if SQL Server is requested
-    
+# Database drivers are imported inside get_connection, so only the driver for
+# the requested engine is loaded. pyodbc is optional - only needed for SQL
+# Server connections - and SQLite runs never pay for loading the ODBC library.
 
 def get_connection(args):
     """
@@ -47,13 +42,16 @@ def get_connection(args):
     """
     # SQLite connection: Simple file-based database
     if args.engine == "sqlite":
+        import sqlite3  # Built-in SQLite database driver
         # Connect to SQLite database file (creates if doesn't exist)
         return sqlite3.connect(args.db_path)
     
     # SQL Server connection: Requires pyodbc and connection string
     elif args.engine == "sqlserver":
-        # Verify pyodbc is available before attempting connection
-        if not pyodbc:
+        # Import pyodbc on demand and fail with a clear message if it's missing
+        try:
+            import pyodbc
+        except ImportError:
             raise RuntimeError("pyodbc is required for SQL Server support.")
         
         # Build ODBC connection string with server and database
@@ -1,23 +1,93 @@
 # Standard library imports for file handling and data processing
 import csv          # For reading CSV-formatted files
+import functools    # For caching generated SQL and the shared HTTP session
+import gc           # For pausing cyclic garbage collection during loads
 import io           # For handling in-memory text streams
+import mmap         # For reading the ZIP archive through a memory map
+import os           # For building temporary part-file paths
+import shutil       # For streaming the download straight to disk
+import tempfile     # For the scratch directory holding part databases
 import time         # For performance timing
+import uuid         # For naming this run's SQL Server staging tables
 import zipfile      # For extracting files from ZIP archives
-import requests     # For HTTP requests to download files
-import socket       # For network connection configuration
-import requests.packages.urllib3.util.connection as urllib3_cn  # For forcing IPv4 connections
+from itertools import islice  # For pulling rows in fixed-size chunks
+from operator import itemgetter  # For C-level key lookups in the row pipeline
+from contextlib import contextmanager  # For the GC pause helper
+from concurrent.futures import ProcessPoolExecutor, as_completed  # For loading tables in parallel
+from email.utils import formatdate, parsedate_to_datetime  # For HTTP date headers
 from config import CONFIG  # Application configuration settings
 
 # ──────────────────────────────────────────────────────────────
 # 📥 Download the FAA ZIP file
 # ──────────────────────────────────────────────────────────────
+def build_session():
+    """
+    Create the HTTP session used to download FAA files.
+
+    The session keeps connections alive between requests, prefers IPv4 to
+    avoid IPv6 issues with the FAA server, sends a browser User-Agent so
+    the request is accepted, and retries transient gateway errors with
+    exponential backoff.
+
+    requests (and urllib3/ssl behind it) is imported here rather than at
+    module level, so CLI runs that never download, such as ``--help`` or
+    ``--skip-download``, don't pay for loading it.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class IPv4Adapter(HTTPAdapter):
+        # Binding each socket to the IPv4 wildcard address makes IPv6
+        # addresses fail immediately, so urllib3 falls through to the
+        # server's IPv4 address. Unlike patching
+        # urllib3.util.connection.allowed_gai_family, this only affects
+        # sessions the adapter is mounted on.
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["source_address"] = ("0.0.0.0", 0)
+            super().init_poolmanager(*args, **kwargs)
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0"
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = IPv4Adapter(max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    """
+    Return the process-wide download session, creating it on first use.
+
+    Reusing one session keeps its pooled connection (and TLS session) alive
+    across downloads in the same process. It is built lazily rather than at
+    import time, so importing this module stays free of network setup.
+
+    Returns:
+        requests.Session: Shared session from build_session()
+    """
+    return build_session()
+
+
 def download_zip(url, zip_path):
     """
     Download the FAA aircraft registry ZIP file from the specified URL.
     
-    This function forces IPv4 connections to avoid potential IPv6 issues
-    with the FAA server. It uses a custom User-Agent header to ensure
-    the request is accepted by the server.
+    The request goes through the shared get_session(), which forces IPv4
+    connections to avoid potential IPv6 issues with the FAA server, sends a
+    custom User-Agent header to ensure the request is accepted, and retries
+    transient server errors.
+
+    If a local copy already exists, the request carries an If-Modified-Since
+    header built from the file's modification time and the download is
+    skipped when the server answers 304 Not Modified. After a download the
+    file's modification time is set to the server's Last-Modified date, so
+    the next run can make the same check.
     
     Args:
         url (str): The URL of the ZIP file to download
@@ -26,96 +96,754 @@ def download_zip(url, zip_path):
     Raises:
         requests.HTTPError: If the download fails (non-200 status code)
     """
-    import socket, requests, requests.packages.urllib3.util.connection as urllib3_cn
-    # Force IPv4 connections only to avoid IPv6 connectivity issues
-    urllib3_cn.allowed_gai_family = lambda: socket.AF_INET
-    # Set User-Agent to mimic a browser request
-    headers = {"User-Agent": "Mozilla/5.0"}
+    headers = {}
+    # Ask the server to skip the transfer if our copy is still current
+    if os.path.exists(zip_path):
+        headers["If-Modified-Since"] = formatdate(os.path.getmtime(zip_path), usegmt=True)
     print(f"📥 Downloading: {url}")
-    # Download the file with a 30-second timeout
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()  # Raise an error for bad status codes
-    # Write the downloaded content to disk
-    with open(zip_path, "wb") as f:
-        f.write(response.content)
+    # Stream the response straight to disk in large chunks so the archive is
+    # never held in memory as a single bytes object. Wait up to 10 seconds
+    # to connect and 60 seconds between received chunks.
+    # The shared session stays open; only the response is closed here.
+    session = get_session()
+    with session.get(url, headers=headers, timeout=(10, 60), stream=True) as response:
+        if response.status_code == 304:
+            print("✅ Local ZIP is up to date, download skipped.")
+            return
+        response.raise_for_status()  # Raise an error for bad status codes
+        # Let urllib3 undo any Content-Encoding while we copy the raw stream
+        response.raw.decode_content = True
+        # Write to a side file so an interrupted download never replaces
+        # (or looks newer than) a good local copy
+        part_path = zip_path + ".part"
+        with open(part_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=CONFIG["IO_BUFFER_SIZE"])
+        os.replace(part_path, zip_path)
+        # Stamp the file with the server's date for the next conditional request
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            timestamp = parsedate_to_datetime(last_modified).timestamp()
+            os.utime(zip_path, (timestamp, timestamp))
     print("✅ Download complete.")
 
-def truncate_tables(cursor, tables):
+# SQLite settings for a one-shot full reload: no rollback journal, no fsync,
+# temp structures in memory and a 256 MB page cache. A crash mid-load can
+# leave the file unusable, which is acceptable because every run rebuilds it.
+SQLITE_BULK_PRAGMAS = (
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA cache_size=-262144",
+)
+
+
+def tune_sqlite_for_bulk_load(cursor):
+    """
+    Apply bulk-insert PRAGMAs and open one transaction for the whole load.
+
+    The PRAGMAs must run before the transaction starts, since SQLite ignores
+    journal mode changes inside an open transaction. The caller is
+    responsible for committing. The parallel load is the exception: SQLite
+    can't attach a part file inside a transaction, so merge_table_file
+    commits around each table it merges and then reopens the transaction.
+
+    Args:
+        cursor: SQLite cursor for executing SQL statements
+    """
+    for pragma in SQLITE_BULK_PRAGMAS:
+        cursor.execute(pragma)
+    # Every DELETE and INSERT below shares this single transaction
+    if not cursor.connection.in_transaction:
+        cursor.execute("BEGIN")
+
+
+def truncate_tables(cursor, tables, engine="sqlite"):
     """
     Remove all existing data from the specified database tables.
     
     This prepares the tables for fresh data loading by deleting all rows.
-    Uses DELETE instead of TRUNCATE for better compatibility across
-    different database systems.
+    SQL Server uses TRUNCATE TABLE, which deallocates whole pages instead of
+    logging every deleted row. SQLite has no TRUNCATE statement, but a
+    DELETE without a WHERE clause on a table without triggers takes its
+    "truncate optimization" and drops the table's pages in one step.
     
     Args:
         cursor: Database cursor object for executing SQL statements
         tables (dict): Dictionary of table names (keys are used)
+        engine (str): Database engine, "sqlite" or "sqlserver" (default: sqlite)
     """
     for table in tables:
-        # Execute DELETE statement for each table (table names are lowercased)
-        cursor.execute(f'DELETE FROM "{table.lower()}"')
+        # Table names are lowercased to match the schema
+        if engine == "sqlserver":
+            cursor.execute(f"TRUNCATE TABLE [{table.lower()}]")
+        else:
+            cursor.execute(f'DELETE FROM "{table.lower()}"')
     print("🧹 Tables truncated.")
 
 
-def load_table_from_zip(zip_file, table_name, columns, cursor, batch_size=5000):
+def drop_secondary_indexes(cursor, tables, engine="sqlite"):
+    """
+    Remove (SQLite) or disable (SQL Server) the secondary indexes of the
+    given tables before a bulk load.
+
+    Maintaining every index on every insert costs far more than building
+    each index once over the finished table. Primary key indexes are left
+    alone because SQLite's INSERT OR IGNORE relies on them for duplicate
+    detection.
+
+    Args:
+        cursor: Database cursor for executing SQL statements
+        tables (dict): Dictionary of table names (keys are used)
+        engine (str): Database engine, "sqlite" or "sqlserver" (default: sqlite)
+
+    Returns:
+        list: What restore_secondary_indexes needs to put the indexes back
+    """
+    names = {table.lower() for table in tables}
+    if engine == "sqlite":
+        # Automatic indexes (primary keys, UNIQUE constraints) have no SQL
+        cursor.execute(
+            "SELECT name, tbl_name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND sql IS NOT NULL"
+        )
+        saved = [(name, sql) for name, table, sql in cursor.fetchall() if table.lower() in names]
+        for name, _ in saved:
+            cursor.execute(f'DROP INDEX "{name}"')
+        return [sql for _, sql in saved]
+
+    cursor.execute(
+        "SELECT i.name, t.name FROM sys.indexes i "
+        "JOIN sys.tables t ON t.object_id = i.object_id "
+        "WHERE i.type_desc = 'NONCLUSTERED' AND i.is_primary_key = 0 "
+        "AND i.is_unique_constraint = 0 AND i.is_disabled = 0"
+    )
+    saved = [(index, table) for index, table in cursor.fetchall() if table.lower() in names]
+    for index, table in saved:
+        cursor.execute(f"ALTER INDEX [{index}] ON [{table}] DISABLE")
+    return saved
+
+
+def restore_secondary_indexes(cursor, saved, engine="sqlite"):
+    """
+    Rebuild the indexes removed by drop_secondary_indexes.
+
+    Args:
+        cursor: Database cursor for executing SQL statements
+        saved (list): Return value of drop_secondary_indexes
+        engine (str): Database engine, "sqlite" or "sqlserver" (default: sqlite)
+    """
+    if engine == "sqlite":
+        for sql in saved:
+            cursor.execute(sql)
+    else:
+        for index, table in saved:
+            cursor.execute(f"ALTER INDEX [{index}] ON [{table}] REBUILD")
+    if saved:
+        print(f"🗂️ Rebuilt {len(saved)} secondary indexes.")
+
+
+@functools.lru_cache(maxsize=None)
+def quote_columns(columns):
+    """
+    Return a table's column names as a quoted, comma-separated SQL list.
+
+    Args:
+        columns (tuple): Column names, in insert order
+
+    Returns:
+        str: The column list, e.g. ``"ID", "NAME"``
+    """
+    # Quote column names for SQL safety (handles reserved words)
+    return ", ".join(f'"{col}"' for col in columns)
+
+
+@functools.lru_cache(maxsize=None)
+def build_insert_sql(table_name, columns, ignore_duplicates=False):
+    """
+    Build (once) the parameterized INSERT statement for a table.
+
+    Statements are cached per table and column list, so every batch and
+    every run in the same process reuses the identical SQL string and the
+    driver can reuse its prepared statement.
+
+    Args:
+        table_name (str): Name of the database table
+        columns (tuple): Column names, in insert order
+        ignore_duplicates (bool): Emit SQLite's ``INSERT OR IGNORE`` so rows
+            whose primary key already exists are skipped (default: False)
+
+    Returns:
+        str: The INSERT statement with one ``?`` placeholder per column
+    """
+    quoted = quote_columns(columns)
+    # Create placeholders for parameterized query (one ? per column)
+    placeholders = ", ".join("?" for _ in columns)
+    verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+    return f'{verb} INTO "{table_name}" ({quoted}) VALUES ({placeholders})'
+
+
+# Suffix that keeps this process's staging tables apart from those of other
+# loads running against the same SQL Server at the same time
+_STAGE_ID = uuid.uuid4().hex[:12]
+
+
+def stage_table_name(table_name):
+    """
+    Return the name of the SQL Server staging table for a table.
+
+    Staging uses a global (``##``) temp table rather than a session (``#``)
+    one: with ``fast_executemany``, the ODBC driver describes the INSERT's
+    parameters in a separate scope that can't see session temp tables and
+    fails with "Invalid object name". Global temp tables are visible there,
+    and the per-process suffix keeps concurrent loads from colliding.
+
+    Args:
+        table_name (str): Name of the database table
+
+    Returns:
+        str: Staging table name, e.g. ``##faa_stage_MASTER_<id>``
+    """
+    return f"##faa_stage_{table_name}_{_STAGE_ID}"
+
+
+@functools.lru_cache(maxsize=None)
+def build_stage_sql(table_name, columns, key_columns, bulk=False):
+    """
+    Build (once) the SQL Server statements that stage and deduplicate a load.
+
+    Rows are first bulk-inserted into a temp table that has no
+    constraints, numbered in arrival order by an identity column. A single
+    ``INSERT ... SELECT`` then copies the first row of every key into the
+    real table, so duplicate detection runs in the database instead of in a
+    Python set of every key in the file. Keys already in the target table
+    are skipped too, matching SQLite's ``INSERT OR IGNORE``.
+
+    The temp table's columns are all nullable. ``BULK INSERT`` loads empty
+    fields as NULL, so for a bulk load the copy reads every column through
+    ``ISNULL(col, N'')`` and stores the same values as a parameterized load.
+
+    Args:
+        table_name (str): Name of the database table
+        columns (tuple): Column names, in insert order
+        key_columns (tuple): Primary key column(s) of the table
+        bulk (bool): Whether the temp table is filled by ``BULK INSERT``
+            (default: False)
+
+    Returns:
+        tuple: ``(create_sql, insert_sql, merge_sql, drop_sql)`` where
+        ``insert_sql`` is the parameterized INSERT into the temp table
+    """
+    stage = stage_table_name(table_name)
+    quoted = quote_columns(columns)
+    partition = quote_columns(key_columns)
+    matches = " AND ".join(f't."{col}" = s."{col}"' for col in key_columns)
+    # Drop any stage left behind by an earlier failed load in this process
+    drop_sql = f"IF OBJECT_ID('tempdb..{stage}') IS NOT NULL DROP TABLE \"{stage}\""
+    # Empty copy of the target's columns (no constraints) plus a row counter.
+    # Selecting them through an outer join that never matches makes every
+    # column nullable, where a plain SELECT INTO keeps the key NOT NULL.
+    create_sql = (
+        f'SELECT TOP 0 IDENTITY(INT, 1, 1) AS "__seq", '
+        + ", ".join(f't."{col}"' for col in columns)
+        + f' INTO "{stage}" FROM (SELECT 1 AS "__one") AS d '
+        f'LEFT JOIN "{table_name}" AS t ON 1 = 0'
+    )
+    source = f'"{stage}"'
+    if bulk:
+        # Turn the NULLs BULK INSERT makes of empty fields back into ''
+        cleaned = ", ".join(f'ISNULL("{col}", N\'\') AS "{col}"' for col in columns)
+        source = f'(SELECT "__seq", {cleaned} FROM "{stage}") AS src'
+    merge_sql = (
+        f'INSERT INTO "{table_name}" ({quoted}) '
+        f'SELECT {quoted} FROM ('
+        f'SELECT *, ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY "__seq") AS "__rn" '
+        f'FROM {source}) AS s '
+        f'WHERE "__rn" = 1 AND NOT EXISTS (SELECT 1 FROM "{table_name}" AS t WHERE {matches})'
+    )
+    return create_sql, build_insert_sql(stage, columns), merge_sql, drop_sql
+
+
+def write_bulk_file(rows, path):
+    """
+    Write staged rows to a data file for SQL Server's ``BULK INSERT``.
+
+    Each row is prefixed with its sequence number, which fills the stage
+    table's ``__seq`` column. Fields and rows are separated by the ASCII
+    unit (0x1F) and record (0x1E) separators, so commas, tabs and line
+    breaks inside values need no quoting. ``BULK INSERT`` loads empty values
+    as NULL; build_stage_sql turns them back into empty strings.
+
+    Args:
+        rows (iterable): Row tuples in arrival order
+        path (str): Data file to create
+
+    Raises:
+        csv.Error: If a value contains one of the separator characters
+    """
+    with open(path, "w", encoding="utf-8", newline="", buffering=CONFIG["IO_BUFFER_SIZE"]) as f:
+        writer = csv.writer(f, delimiter="\x1f", lineterminator="\x1e",
+                            quoting=csv.QUOTE_NONE, quotechar=None)
+        writer.writerows((seq, *values) for seq, values in enumerate(rows, 1))
+
+
+def build_bulk_insert_sql(table_name, path):
+    """
+    Build the ``BULK INSERT`` statement that loads a data file written by
+    ``write_bulk_file`` into a table's stage.
+
+    Args:
+        table_name (str): Name of the database table
+        path (str): Data file path as seen by the SQL Server service
+
+    Returns:
+        str: The BULK INSERT statement
+    """
+    # BULK INSERT takes the file name as a literal, not a parameter.
+    # CODEPAGE 65001 (UTF-8) needs SQL Server 2016 or later on Windows.
+    literal = path.replace("'", "''")
+    return (
+        f"BULK INSERT \"{stage_table_name(table_name)}\" FROM '{literal}' WITH ("
+        "FIELDTERMINATOR = '0x1f', ROWTERMINATOR = '0x1e', CODEPAGE = '65001', "
+        "KEEPIDENTITY, TABLOCK)"
+    )
+
+
+def sqlserver_primary_key(cursor, table_name, columns):
+    """
+    Look up the primary key columns of a SQL Server table.
+
+    Args:
+        cursor: Database cursor for executing SQL statements
+        table_name (str): Name of the database table
+        columns (list): Column names being loaded
+
+    Returns:
+        tuple: Primary key column names, or the first loaded column if the
+        table has no primary key
+    """
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE "
+        "WHERE OBJECTPROPERTY(OBJECT_ID(QUOTENAME(CONSTRAINT_SCHEMA) + '.' + QUOTENAME(CONSTRAINT_NAME)), "
+        "'IsPrimaryKey') = 1 AND TABLE_NAME = ? ORDER BY ORDINAL_POSITION",
+        table_name,
+    )
+    return tuple(row[0] for row in cursor.fetchall()) or (columns[0],)
+
+
+def make_row_builder(idx):
+    """
+    Return a function that turns one raw CSV row into the tuple to insert.
+
+    This is the per-row hot path of every load, so the returned function
+    is generated for the given layout and does as little as possible: pick
+    the columns in ``idx`` and trim them. FAA fields are padded on the right
+    to their fixed width, so trailing whitespace is removed here; any
+    leading blanks are already skipped by the CSV reader.
+
+    Args:
+        idx (list): Position of each output column in the raw CSV row
+
+    Returns:
+        callable: ``build_row(row) -> tuple``
+    """
+    # Generate a function specialized to this table's layout, e.g.
+    #     def build_row(row): return (row[3].rstrip(), row[0].rstrip(), )
+    # Straight-line indexing and method calls with constant positions run
+    # faster than a generic itemgetter + map pipeline, and the trailing
+    # comma keeps single-column tables a 1-tuple.
+    values = [f"row[{int(i)}].rstrip()" for i in idx]
+    source = f"def build_row(row): return ({''.join(v + ', ' for v in values)})"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["build_row"]
+
+
+def report_table_load(table_name, inserted, skipped):
+    """
+    Print the row counts of one loaded table.
+
+    Args:
+        table_name (str): Name of the loaded table
+        inserted (int): Rows inserted
+        skipped (int): Rows read but not inserted
+    """
+    print(f"📦 Loaded {inserted:,} rows into {table_name.lower()} (skipped {skipped:,}).")
+
+
+def load_table_from_zip(zip_file, table_name, columns, cursor, batch_size=20000, engine="sqlite",
+                        bulk_dir=None, report=True):
     """
     Load data from a CSV file within a ZIP archive into a database table.
     
-    This function reads a CSV file from the ZIP, removes duplicates based on
-    the first column (assumed to be the primary key), and inserts the data
-    in batches for optimal performance.
+    This function reads a CSV file from the ZIP, skips rows without a value
+    in the first column, and inserts the data keeping only the first row of
+    each primary key.
+
+    Duplicates are always discarded by the database against the table's
+    primary key, so no keys are tracked in Python. On SQLite, the whole file
+    is streamed through a single ``executemany`` with ``INSERT OR IGNORE``.
+    SQL Server has no equivalent statement, so there rows are sent in
+    batches of ``batch_size`` to a temp table and copied over once with one
+    deduplicating ``INSERT ... SELECT`` (see ``build_stage_sql``). With
+    ``bulk_dir``, the temp table is instead filled by one ``BULK INSERT`` of
+    a data file written there, skipping per-row parameter binding.
     
     Args:
         zip_file (ZipFile): Open ZipFile object containing the data files
         table_name (str): Name of the database table to load
         columns (list): List of column names in the order they appear in the CSV
         cursor: Database cursor for executing SQL statements
-        batch_size (int): Number of rows to insert per batch (default: 5000)
+        batch_size (int): Number of rows to insert per batch on SQL Server
+            (default: 20000)
+        engine (str): Database engine, "sqlite" or "sqlserver" (default: sqlite)
+        bulk_dir (str): SQL Server only: directory, readable by the SQL Server
+            service under the same path, to stage data files for
+            ``BULK INSERT`` (default: None, use executemany)
+        report (bool): Print the row counts when done (default: True)
+
+    Returns:
+        tuple: ``(inserted, skipped)`` row counts
+
+    Raises:
+        ValueError: If a column in ``columns`` is missing from the file header
     """
     # Construct the filename within the ZIP (e.g., "MASTER.txt")
     filename = f"{table_name}.txt"
-    # First column is used as the primary key for duplicate detection
-    key_column = columns[0]
-    # Quote column names for SQL safety (handles reserved words)
-    quoted = [f'"{col}"' for col in columns]
-    # Create placeholders for parameterized query (one ? per column)
-    placeholders = ', '.join(['?' for _ in columns])
-    # Build the INSERT SQL statement
-    sql = f'INSERT INTO "{table_name}" ({", ".join(quoted)}) VALUES ({placeholders})'
-
-    # Initialize tracking variables
-    seen_keys = set()      # Track unique keys to prevent duplicates
-    batch = []             # Accumulate rows for batch insertion
     total_inserted = 0     # Count of successfully inserted rows
-    skipped = 0            # Count of duplicate/empty rows skipped
 
     # Open the CSV file from within the ZIP archive
-    with zip_file.open(filename) as f:
-        # Wrap the binary stream in a text wrapper with UTF-8 BOM handling
-        reader = csv.DictReader(io.TextIOWrapper(f, encoding="utf-8-sig"))
-        for row in reader:
-            # Extract and clean the primary key value
-            key = row.get(key_column, "").strip()
-            # Only process rows with non-empty, unique keys
-            if key and key not in seen_keys:
-                seen_keys.add(key)  # Mark this key as seen
-                # Build tuple of values in correct column order, stripping whitespace
-                batch.append(tuple(row.get(col, "").strip() for col in columns))
-                # When batch reaches target size, insert to database
-                if len(batch) >= batch_size:
-                    cursor.executemany(sql, batch)
-                    total_inserted += len(batch)
-                    batch.clear()  # Reset batch for next group
+    with zip_file.open(filename) as raw:
+        # Read the entry through a large buffer so inflate and UTF-8 decoding
+        # work on big chunks instead of many small reads
+        f = io.BufferedReader(raw, buffer_size=CONFIG["IO_BUFFER_SIZE"])
+        # Wrap the binary stream in a text wrapper with UTF-8 BOM handling;
+        # stray non-UTF-8 bytes become U+FFFD instead of aborting the load
+        text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="", errors="replace")
+        # skipinitialspace drops blanks after each delimiter inside the C
+        # parser, so the row builder below only has to trim the right side
+        reader = csv.reader(text, skipinitialspace=True)
+        # Resolve each column to its position in the header once, so rows can
+        # be indexed as plain lists instead of building a dict per row
+        header = [name.strip() for name in next(reader, [])]
+        idx = [header.index(col) for col in columns]
+        # Positions (within the output tuple) of low-cardinality code columns
+        build_row = make_row_builder(idx)
+
+        # Skip blank lines, build each row, and drop rows without a key
+        # (the key is the first value of each tuple). map/filter are lazy,
+        # so rows are produced only as the database consumes them.
+        rows = filter(itemgetter(0), map(build_row, filter(None, reader)))
+
+        if engine == "sqlite":
+            # SQLite skips rows whose primary key already exists
+            sql = build_insert_sql(table_name, tuple(columns), ignore_duplicates=True)
+            # One executemany over the whole pipeline: sqlite3 pulls rows in
+            # C, so there is no Python-level loop or batching per row
+            changes_before = cursor.connection.total_changes
+            cursor.executemany(sql, rows)
+            # Rows ignored by SQLite don't count as changes
+            total_inserted = cursor.connection.total_changes - changes_before
+        else:
+            key_columns = sqlserver_primary_key(cursor, table_name, columns)
+            create_sql, stage_sql, merge_sql, drop_sql = build_stage_sql(
+                table_name, tuple(columns), key_columns, bulk=bool(bulk_dir))
+            cursor.execute(drop_sql)
+            cursor.execute(create_sql)
+            if bulk_dir:
+                # Let the server read every row from a file in one statement
+                bulk_path = os.path.join(bulk_dir, f"{table_name}.dat")
+                try:
+                    write_bulk_file(rows, bulk_path)
+                    cursor.execute(build_bulk_insert_sql(table_name, bulk_path))
+                finally:
+                    # Also removes a partial file if writing it failed
+                    if os.path.exists(bulk_path):
+                        os.remove(bulk_path)
             else:
-                skipped += 1  # Count duplicates or empty keys
+                # Stage every row, pulling the pipeline in chunks of
+                # batch_size so only one batch of rows is held at a time
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    cursor.executemany(stage_sql, batch)
+            # Keep the first row of each key; rowcount is what was inserted
+            cursor.execute(merge_sql)
+            total_inserted = cursor.rowcount
+            cursor.execute(drop_sql)
+
+        # Everything read after the header but not inserted was skipped
+        # (duplicates, rows without a key and blank lines)
+        skipped = reader.line_num - 1 - total_inserted
+
+    if report:
+        report_table_load(table_name, total_inserted, skipped)
+    return total_inserted, skipped
+
+
+class _SeekableMmap(mmap.mmap):
+    # ZipFile checks seekable(), which mmap objects don't provide
+    def seekable(self):
+        return True
+
+
+class MappedZipFile(zipfile.ZipFile):
+    """
+    ZipFile that reads its archive through a read-only memory map.
+
+    Central-directory parsing and member inflation then read straight from
+    the page cache instead of issuing many small buffered ``read()`` calls,
+    without copying the archive into a ``BytesIO``.
+
+    Args:
+        path (str): Path to the ZIP archive
+    """
+
+    def __init__(self, path):
+        # The map keeps its own handle, so the file can be closed right away
+        with open(path, "rb") as fh:
+            self._map = _SeekableMmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            super().__init__(self._map)
+        except Exception:
+            self._map.close()
+            raise
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._map.close()
+
+
+class ExtractedArchive:
+    """
+    Stand-in for ``zipfile.ZipFile`` that serves members from plain files
+    extracted next to the archive.
+
+    Each member is inflated into ``directory`` the first time it is opened.
+    The extracted copy is stamped with the archive's modification time and
+    reused only while the archive still carries that exact time, so repeated
+    runs against the same download skip the inflate step entirely and read
+    from the OS page cache, while any replaced archive is re-extracted, even
+    one dated earlier (download_zip stamps the server's Last-Modified
+    date). Because extraction happens in ``open()``, parallel workers each
+    inflate their own table concurrently.
+
+    Only the parts of the ZipFile interface the loader uses are provided:
+    ``open(name)`` and use as a context manager.
+
+    Args:
+        zip_path (str): Path to the FAA ZIP archive
+        directory (str): Directory holding the extracted ``.txt`` files
+    """
+
+    def __init__(self, zip_path, directory):
+        self.zip_path = zip_path
+        self.directory = directory
+        self._zip = None  # Opened only if a member needs extracting
+
+    def open(self, name):
+        target = os.path.join(self.directory, name)
+        zip_mtime = os.stat(self.zip_path).st_mtime_ns
+        if not os.path.exists(target) or os.stat(target).st_mtime_ns != zip_mtime:
+            self._extract(name, target, zip_mtime)
+        # Unbuffered: load_table_from_zip adds its own large buffer
+        return open(target, "rb", buffering=0)
+
+    def _extract(self, name, target, zip_mtime):
+        if self._zip is None:
+            self._zip = MappedZipFile(self.zip_path)
+        os.makedirs(self.directory, exist_ok=True)
+        # Inflate into a side file and rename it into place, so an
+        # interrupted extraction never leaves a truncated "current" copy.
+        # Reading the member to the end also verifies its CRC once.
+        part_path = target + ".part"
+        with self._zip.open(name) as src, open(part_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, CONFIG["IO_BUFFER_SIZE"])
+        # Record which archive this copy came from
+        os.utime(part_path, ns=(zip_mtime, zip_mtime))
+        os.replace(part_path, target)
+        print(f"🗜️ Extracted {name} to {self.directory}")
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
 
-        # Insert any remaining rows in the final partial batch
-        if batch:
-            cursor.executemany(sql, batch)
-            total_inserted += len(batch)
+    def __enter__(self):
+        return self
 
-    print(f"📦 Loaded {total_inserted:,} rows into {table_name.lower()} (skipped {skipped:,}).")
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+def open_archive(zip_path, extract_dir=None):
+    """
+    Open the FAA ZIP archive for reading its ``<TABLE>.txt`` members.
+
+    Args:
+        zip_path (str): Path to the FAA ZIP archive
+        extract_dir (str): If given, serve members from plain files
+            extracted (and cached) in this directory (default: None)
+
+    Returns:
+        MappedZipFile or ExtractedArchive: Object whose ``open(name)`` returns a
+        binary stream for each member
+    """
+    if extract_dir:
+        return ExtractedArchive(zip_path, extract_dir)
+    return MappedZipFile(zip_path)
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause CPython's cyclic garbage collector for the duration of a load.
+
+    Loading allocates millions of short-lived row tuples, and each batch of
+    them keeps triggering collections that re-scan every surviving object
+    although rows never form reference cycles; reference counting frees
+    them on its own. The collector's previous state is restored on exit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def load_table_to_file(zip_path, table_name, columns, ddl, part_path, extract_dir=None):
+    """
+    Load one table from the ZIP archive into its own SQLite part file.
+
+    Runs in a worker process: it opens its own ZipFile and connection, so
+    CSV parsing for different tables proceeds in parallel without sharing
+    the GIL or a SQLite writer lock with other workers. Nothing is printed
+    here, so concurrent workers can't garble the console; the parent reports
+    the returned counts.
+
+    Args:
+        zip_path (str): Path to the FAA ZIP archive
+        table_name (str): Name of the table to load
+        columns (list): List of column names in the order they appear in the CSV
+        ddl (str): CREATE TABLE statement copied from the target database
+        part_path (str): Path of the SQLite file to create for this table
+        extract_dir (str): Extraction cache directory, see open_archive
+            (default: None)
+
+    Returns:
+        tuple: ``(part_path, inserted, skipped)``, for the caller to merge
+        and report
+    """
+    # Imported here, like in db_connection, so SQL Server runs never load it
+    import sqlite3
+    conn = sqlite3.connect(part_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(ddl)
+        tune_sqlite_for_bulk_load(cursor)
+        with gc_paused(), open_archive(zip_path, extract_dir) as z:
+            inserted, skipped = load_table_from_zip(z, table_name, columns, cursor,
+                                                    engine="sqlite", report=False)
+        conn.commit()
+    finally:
+        conn.close()
+    return part_path, inserted, skipped
+
+
+def merge_table_file(cursor, table_name, columns, part_path):
+    """
+    Copy every row of a part file produced by load_table_to_file into the
+    matching table of the main database.
+
+    The part file is attached to the main connection and copied with one
+    ``INSERT ... SELECT``, so rows move page to page inside SQLite without
+    being turned into Python tuples. SQLite can't attach a database inside
+    a transaction, so the load transaction is committed first and a new
+    one is opened afterwards for the rest of the load.
+
+    Args:
+        cursor: Cursor on the main SQLite database
+        table_name (str): Name of the table to merge
+        columns (list): List of column names to copy
+        part_path (str): Path of the part file holding the loaded rows
+    """
+    connection = cursor.connection
+    quoted = quote_columns(tuple(columns))
+    connection.commit()
+    cursor.execute("ATTACH DATABASE ? AS part", (part_path,))
+    try:
+        cursor.execute(
+            f'INSERT INTO main."{table_name}" ({quoted}) SELECT {quoted} FROM part."{table_name}"'
+        )
+        connection.commit()
+    finally:
+        cursor.execute("DETACH DATABASE part")
+    cursor.execute("BEGIN")
+
+
+def table_ddl(cursor, table_name):
+    """
+    Return the CREATE TABLE statement of an existing SQLite table.
+
+    Args:
+        cursor: SQLite cursor for executing SQL statements
+        table_name (str): Table name (case-insensitive)
+
+    Raises:
+        ValueError: If the table does not exist
+    """
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ? COLLATE NOCASE",
+        (table_name,),
+    )
+    row = cursor.fetchone()
+    if row is None:
+        raise ValueError(f"Table {table_name} does not exist.")
+    return row[0]
+
+
+def run_parallel_sqlite_load(config, cursor, workers, extract_dir=None):
+    """
+    Load every table into a separate SQLite file in a process pool, then
+    merge the part files into the main database in the order the workers
+    finish.
+
+    Args:
+        config (dict): Configuration dictionary containing TABLES and ZIP_PATH
+        cursor: Cursor on the main SQLite database
+        workers (int): Number of worker processes
+        extract_dir (str): Extraction cache directory, see open_archive
+            (default: None)
+    """
+    tables = config["TABLES"]
+    # Workers recreate each table exactly as the schema defines it
+    ddl = {table: table_ddl(cursor, table) for table in tables}
+    start = time.time()
+    with tempfile.TemporaryDirectory(prefix="faa_load_") as tmp_dir:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    load_table_to_file, config["ZIP_PATH"], table, columns, ddl[table],
+                    os.path.join(tmp_dir, f"load_{table}.db"), extract_dir,
+                ): table
+                for table, columns in tables.items()
+            }
+            # Merge each table as soon as its worker finishes, so the main
+            # database is written while the slower tables are still parsing
+            for future in as_completed(futures):
+                table = futures[future]
+                part_path, inserted, skipped = future.result()
+                merge_table_file(cursor, table, tables[table], part_path)
+                os.remove(part_path)  # Free the disk space right away
+                report_table_load(table, inserted, skipped)
+                # Report how long this table took, including the parallel load
+                print(f"⏱️ {table} loaded in {time.time() - start:.2f} seconds")
 
 
 def run_loader(config, args, cursor):
@@ -124,24 +852,57 @@ def run_loader(config, args, cursor):
     
     This function coordinates the complete loading process:
     1. Truncates all target tables to remove old data
-    2. Opens the ZIP archive containing FAA data files
-    3. Loads each table from its corresponding CSV file within the ZIP
-    4. Reports timing information for each table
+    2. Drops secondary indexes so they are built once after the load
+    3. Opens the ZIP archive containing FAA data files
+    4. Loads each table from its corresponding CSV file within the ZIP
+    5. Reports timing information for each table
+    6. Rebuilds the secondary indexes
+
+    With SQLite and more than one worker, tables are parsed in parallel
+    processes and merged into the main database (see
+    run_parallel_sqlite_load). The serial path leaves all work in one open
+    transaction for the caller to commit; the parallel path commits after
+    each table it merges, so only the work after the last merge (such as
+    rebuilding indexes) is left for the caller's commit.
     
     Args:
-        config (dict): Configuration dictionary containing TABLES and ZIP_PATH
-        args: Command-line arguments object with batch_size attribute
+        config (dict): Configuration dictionary containing TABLES, ZIP_PATH
+            and EXTRACT_DIR
+        args: Command-line arguments object with engine, batch_size,
+            workers, extract and bulk_dir attributes
         cursor: Database cursor for executing SQL statements
     """
+    # Switch SQLite into bulk-load mode before touching any rows
+    if args.engine == "sqlite":
+        tune_sqlite_for_bulk_load(cursor)
+    elif args.engine == "sqlserver":
+        # Send each executemany batch as one parameter array instead of one
+        # round trip per row
+        cursor.fast_executemany = True
+
     # First, clear all existing data from the tables
-    truncate_tables(cursor, config["TABLES"])
-    
-    # Open the ZIP file containing all the FAA data files
-    with zipfile.ZipFile(config["ZIP_PATH"]) as z:
-        # Process each table defined in the configuration
-        for table, columns in config["TABLES"].items():
-            start = time.time()  # Start timing for this table
-            # Load the data from the ZIP into the database table
-            load_table_from_zip(z, table, columns, cursor, batch_size=args.batch_size)
-            # Report how long this table took to load
-            print(f"⏱️ {table} loaded in {time.time() - start:.2f} seconds")
\ No newline at end of file
+    truncate_tables(cursor, config["TABLES"], args.engine)
+    # Build secondary indexes once at the end instead of on every insert
+    saved_indexes = drop_secondary_indexes(cursor, config["TABLES"], args.engine)
+
+    # Optionally inflate each member once and read plain files from then on
+    extract_dir = config["EXTRACT_DIR"] if args.extract else None
+
+    # Never start more workers than there are tables to load
+    workers = min(args.workers or 1, len(config["TABLES"]))
+    if args.engine == "sqlite" and workers > 1:
+        run_parallel_sqlite_load(config, cursor, workers, extract_dir)
+    else:
+        # Open the ZIP file (or extracted directory) containing all the FAA data files
+        with gc_paused(), open_archive(config["ZIP_PATH"], extract_dir) as z:
+            # Process each table defined in the configuration
+            for table, columns in config["TABLES"].items():
+                start = time.time()  # Start timing for this table
+                # Load the data from the ZIP into the database table
+                load_table_from_zip(z, table, columns, cursor,
+                                    batch_size=args.batch_size, engine=args.engine,
+                                    bulk_dir=args.bulk_dir)
+                # Report how long this table took to load
+                print(f"⏱️ {table} loaded in {time.time() - start:.2f} seconds")
+
+    restore_secondary_indexes(cursor, saved_indexes, args.engine)
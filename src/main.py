@@ -15,7 +15,7 @@ The modular design separates concerns, making the codebase:
 """
 
 import argparse  # For parsing command-line arguments
-import os        # For environment variable access in error messages
+import os        # For environment variable access and CPU count
 
 # Import database connection factory - abstracts SQLite vs SQL Server differences
 from db_connection import get_connection
@@ -88,14 +88,31 @@ def parse_args():
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=5000,
-        help="Number of rows to insert per batch (default: 5000)"
+        default=20000,
+        help="Rows per executemany batch on SQL Server; SQLite streams each table in one call (default: 20000)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Parallel worker processes for SQLite table loads; 1 loads serially (default: CPU count)"
+    )
+    parser.add_argument(
+        "--bulk-dir",
+        help="SQL Server only: load with BULK INSERT via data files staged in this directory, "
+             "which the SQL Server service must be able to read under the same path. "
+             "Requires SQL Server 2016 or later on Windows (UTF-8 CODEPAGE 65001)"
     )
     parser.add_argument(
         "--skip-download",
         action="store_true",
         help="Skip downloading ZIP file (use existing local file)"
     )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Extract the ZIP once to data/extracted and load from the plain files (faster repeat runs)"
+    )
     parser.add_argument(
         "--no-create-db",
         action="store_true",
@@ -104,6 +121,18 @@ def parse_args():
     
     args = parser.parse_args()
     
+    # Rows are staged in chunks of batch_size, so it must be at least one row
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    
+    # --bulk-dir is only used by the SQL Server loader. The server opens the
+    # files itself, so a relative path would resolve against its own working
+    # directory rather than ours.
+    if args.bulk_dir:
+        if args.engine != "sqlserver":
+            parser.error("--bulk-dir is only supported with --engine sqlserver")
+        args.bulk_dir = os.path.abspath(args.bulk_dir)
+    
     # Validate SQL Server required arguments
     if args.engine == "sqlserver":
         if not args.server or not args.database:
@@ -228,8 +257,11 @@ def main():
     # Passes CONFIG dict, args namespace, and cursor to the loader module
     run_loader(CONFIG, args, cursor)
     
-    # Commit all changes to make them permanent
-    # This is critical - without commit, all work would be rolled back
+    # Commit all remaining changes to make them permanent
+    # This is critical - without commit, all uncommitted work would be rolled
+    # back. A serial load leaves everything to this commit; the parallel SQLite
+    # load has already committed each merged table, leaving only the index
+    # rebuild.
     conn.commit()
     
     # Clean up: close the database connection and release resources
@@ -1,16 +1,51 @@
+import functools
+import re
+
 from config import CONFIG
 from convert import convert_schema
 
+# One SQL statement: runs of anything but ";" where "--" comments and quoted
+# strings and identifiers ('...', "...", [...]) are taken whole, so a ";" or
+# an apostrophe inside them doesn't end the statement
+_STATEMENT_RE = re.compile(r"""(?:--[^\n]*|'[^']*'|"[^"]*"|\[[^\]]*\]|[^;'"\[])+""")
+
+
+def split_statements(sql):
+    """
+    Split a SQL script into its statements, ignoring semicolons in quotes.
+
+    Args:
+        sql (str): Script with ``;``-terminated statements
+
+    Returns:
+        list: Non-empty statements, stripped, without the trailing ``;``
+
+    Raises:
+        ValueError: If the script has an unterminated quote
+    """
+    # Anything the pattern can't consume besides the ";" separators is the
+    # opening character of an unterminated quote
+    if _STATEMENT_RE.sub("", sql).strip("; \t\r\n"):
+        raise ValueError("Unterminated quote in SQL script")
+    return [stmt.strip() for stmt in _STATEMENT_RE.findall(sql) if stmt.strip()]
+
+
+@functools.lru_cache(maxsize=2)
+def _load_schema(engine, schema_file):
+    # Read (and for SQL Server convert and split) the schema once per
+    # engine; every later initialize_schema call reuses the result
+    with open(schema_file, "r", encoding="utf-8") as f:
+        sqlite_sql = f.read()
+    if engine == "sqlserver":
+        return tuple(split_statements(convert_schema(sqlite_sql)))
+    return sqlite_sql
+
+
 def initialize_schema(cursor, engine):
-    schema_file = CONFIG["SCHEMA_PATH"]
+    schema = _load_schema(engine, CONFIG["SCHEMA_PATH"])
     if engine == "sqlserver":
-        with open(schema_file, "r", encoding="utf-8") as f:
-            sqlite_sql = f.read()
-        schema_sql = convert_schema(sqlite_sql)
-        statements = [s.strip() for s in schema_sql.split(";") if s.strip()]
-        for stmt in statements:
+        for stmt in schema:
             cursor.execute(stmt)
     else:
-        with open(schema_file, "r", encoding="utf-8") as f:
-            cursor.executescript(f.read())
-    print("🧱 Schema initialized.")
\ No newline at end of file
+        cursor.executescript(schema)
+    print("🧱 Schema initialized.")
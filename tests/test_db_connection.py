@@ -1,6 +1,6 @@
 import pytest
 from db_connection import get_connection
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 def test_get_connection_sqlite():
     class Args:
@@ -25,7 +25,18 @@ def test_sqlserver_connection_string_trusted():
         username = None
         password = None
 
-    with patch("db_connection.pyodbc.connect") as mock_connect:
+    mock_pyodbc = MagicMock()
+    with patch.dict("sys.modules", {"pyodbc": mock_pyodbc}):
         get_connection(Args())
+        mock_connect = mock_pyodbc.connect
         mock_connect.assert_called_once()
-        assert "Trusted_Connection=yes" in mock_connect.call_args[0][0]
\ No newline at end of file
+        assert "Trusted_Connection=yes" in mock_connect.call_args[0][0]
+
+def test_sqlserver_requires_pyodbc():
+    class Args:
+        engine = "sqlserver"
+
+    # A None entry in sys.modules makes the import raise ImportError
+    with patch.dict("sys.modules", {"pyodbc": None}):
+        with pytest.raises(RuntimeError):
+            get_connection(Args())
\ No newline at end of file
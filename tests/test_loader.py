@@ -1,5 +1,8 @@
-import io, zipfile, csv
-from loader import load_table_from_zip
+import io, os, zipfile, csv
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from loader import download_zip, load_table_from_zip, open_archive, run_loader
 
 def test_load_table_from_zip_inserts_unique_rows(tmp_path):
     # Create a fake ZIP with a sample table
@@ -14,11 +17,250 @@ def test_load_table_from_zip_inserts_unique_rows(tmp_path):
     import sqlite3
     conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
-    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT, "NAME" TEXT)')
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
 
     # Run loader
     with zipfile.ZipFile(zip_path, "r") as zf:
         load_table_from_zip(zf, table_name, columns, cursor)
 
     cursor.execute("SELECT COUNT(*) FROM TEST")
-    assert cursor.fetchone()[0] == 2  # deduplicated by ID
\ No newline at end of file
+    assert cursor.fetchone()[0] == 2  # deduplicated by ID
+
+
+def test_run_loader_rebuilds_secondary_indexes(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice\n2,Bob\n")
+
+    import sqlite3
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
+    cursor.execute('CREATE INDEX idx_test_name ON "TEST" ("NAME")')
+
+    config = {"TABLES": {"TEST": ["ID", "NAME"]}, "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlite", batch_size=5000, workers=1, extract=False, bulk_dir=None)
+    run_loader(config, args, cursor)
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+    assert cursor.fetchall() == [("idx_test_name",)]
+    cursor.execute("SELECT COUNT(*) FROM TEST")
+    assert cursor.fetchone()[0] == 2
+
+
+def test_download_zip_streams_to_disk_and_skips_when_unchanged(tmp_path):
+    zip_path = str(tmp_path / "faa.zip")
+
+    response = MagicMock(status_code=200, raw=io.BytesIO(b"zip-bytes"),
+                         headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+    response.__enter__.return_value = response
+    session = MagicMock()
+    session.get.return_value = response
+
+    with patch("loader.get_session", return_value=session):
+        download_zip("https://example.test/faa.zip", zip_path)
+        assert session.get.call_args.kwargs["stream"] is True
+        with open(zip_path, "rb") as f:
+            assert f.read() == b"zip-bytes"
+        assert os.path.getmtime(zip_path) == 1735689600
+
+        # Second run sends If-Modified-Since and keeps the file on 304
+        response.status_code = 304
+        download_zip("https://example.test/faa.zip", zip_path)
+        assert "If-Modified-Since" in session.get.call_args.kwargs["headers"]
+        with open(zip_path, "rb") as f:
+            assert f.read() == b"zip-bytes"
+    # The shared session is reused, never closed by a download
+    session.close.assert_not_called()
+
+
+def test_load_table_from_zip_maps_columns_by_header_name(tmp_path):
+    # Header order differs from the column list, has an extra column and the
+    # FAA-style trailing comma; values carry fixed-width padding, and a stray
+    # leading blank must be trimmed as well
+    data = "NAME ,EXTRA,ID ,\nAlice   ,x,1  ,\n Bob    ,y, 2 ,\n"
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", data)
+
+    import sqlite3
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        load_table_from_zip(zf, "TEST", ["ID", "NAME"], cursor)
+
+    cursor.execute('SELECT "ID", "NAME" FROM TEST ORDER BY "ID"')
+    assert cursor.fetchall() == [("1", "Alice"), ("2", "Bob")]
+
+
+def test_load_table_from_zip_single_column_table(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\nN123  ,Alice\nN45   ,Bob\n")
+
+    import sqlite3
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY)')
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        load_table_from_zip(zf, "TEST", ["ID"], cursor)
+
+    cursor.execute('SELECT "ID" FROM TEST ORDER BY "ID"')
+    assert cursor.fetchall() == [("N123",), ("N45",)]
+
+
+def test_run_loader_uses_bulk_pragmas_in_one_transaction(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice\n2,Bob\n")
+
+    import sqlite3
+    conn = sqlite3.connect(tmp_path / "test.db")
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
+    conn.commit()
+
+    config = {"TABLES": {"TEST": ["ID", "NAME"]}, "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlite", batch_size=5000, workers=1, extract=False, bulk_dir=None)
+    run_loader(config, args, cursor)
+
+    # Nothing is committed until the caller commits the single transaction
+    assert conn.in_transaction
+    assert cursor.execute("PRAGMA journal_mode").fetchone() == ("off",)
+    assert cursor.execute("PRAGMA synchronous").fetchone() == (0,)
+    conn.commit()
+    assert cursor.execute("SELECT COUNT(*) FROM TEST").fetchone() == (2,)
+
+
+def test_run_loader_sqlserver_uses_fast_executemany(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice\n2,Bob\n1,Alice\n")
+
+    cursor = MagicMock()
+    cursor.fetchall.return_value = []  # No secondary indexes, no primary key
+    cursor.rowcount = 2
+    # The side_effect collects the rows from every executemany call
+    staged = []
+    cursor.executemany.side_effect = lambda sql, rows: staged.extend(rows)
+    config = {"TABLES": {"TEST": ["ID", "NAME"]}, "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlserver", batch_size=2, workers=4, extract=False, bulk_dir=None)
+    run_loader(config, args, cursor)
+
+    assert cursor.fast_executemany is True
+    cursor.execute.assert_any_call("TRUNCATE TABLE [test]")
+    # Every row goes to the temp table; the database drops the duplicate
+    # Staged in a global temp table the ODBC driver can describe
+    assert cursor.executemany.call_args[0][0].startswith('INSERT INTO "##faa_stage_TEST_')
+    assert staged == [("1", "Alice"), ("2", "Bob"), ("1", "Alice")]
+    executed = [c[0][0] for c in cursor.execute.call_args_list]
+    merge = next(sql for sql in executed if sql.startswith('INSERT INTO "TEST"'))
+    assert 'PARTITION BY "ID"' in merge
+
+
+def test_run_loader_sqlserver_bulk_insert_from_staged_file(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice  \n2,\"Bob, Jr\"\n")
+    bulk_dir = tmp_path / "bulk"
+    bulk_dir.mkdir()
+
+    cursor = MagicMock()
+    cursor.fetchall.return_value = []
+    cursor.rowcount = 2
+    # The data file is removed after loading, so read it when it's used
+    bulk_files = []
+    def execute(sql, *params):
+        if sql.startswith("BULK INSERT"):
+            with open(bulk_dir / "TEST.dat", encoding="utf-8", newline="") as f:
+                bulk_files.append(f.read())
+    cursor.execute.side_effect = execute
+    config = {"TABLES": {"TEST": ["ID", "NAME"]}, "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlserver", batch_size=5000, workers=1, extract=False,
+                           bulk_dir=str(bulk_dir))
+    run_loader(config, args, cursor)
+
+    cursor.executemany.assert_not_called()
+    assert bulk_files == ["1\x1f1\x1fAlice\x1e2\x1f2\x1fBob, Jr\x1e"]
+    assert list(bulk_dir.iterdir()) == []
+    executed = [c[0][0] for c in cursor.execute.call_args_list]
+    # Stage columns are nullable, and empty fields are stored as '' again
+    create = next(sql for sql in executed if sql.startswith("SELECT TOP 0"))
+    assert 'LEFT JOIN "TEST" AS t ON 1 = 0' in create
+    merge = next(sql for sql in executed if sql.startswith('INSERT INTO "TEST"'))
+    assert 'ISNULL("ID", N\'\') AS "ID"' in merge and 'ISNULL("NAME", N\'\') AS "NAME"' in merge
+
+
+def test_run_loader_sqlserver_bulk_removes_partial_file(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        # A unit separator inside a value can't be written to the data file
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice\n2,Bad\x1fName\n")
+    bulk_dir = tmp_path / "bulk"
+    bulk_dir.mkdir()
+
+    cursor = MagicMock()
+    cursor.fetchall.return_value = []
+    config = {"TABLES": {"TEST": ["ID", "NAME"]}, "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlserver", batch_size=5000, workers=1, extract=False,
+                           bulk_dir=str(bulk_dir))
+    with pytest.raises(csv.Error):
+        run_loader(config, args, cursor)
+
+    assert list(bulk_dir.iterdir()) == []
+
+
+def test_extracted_archive_refreshes_when_zip_is_replaced(tmp_path):
+    zip_path = tmp_path / "test.zip"
+    extract_dir = tmp_path / "extracted"
+
+    def write_zip(data, mtime):
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("TEST.txt", data)
+        os.utime(zip_path, (mtime, mtime))
+
+    def read_member():
+        with open_archive(str(zip_path), str(extract_dir)) as z, z.open("TEST.txt") as f:
+            return f.read()
+
+    write_zip("ID\n1\n", 1735689600)
+    assert read_member() == b"ID\n1\n"
+    # Reused while the archive is unchanged
+    assert read_member() == b"ID\n1\n"
+    # A replacement dated earlier than the extraction is still picked up
+    write_zip("ID\n2\n", 1704067200)
+    assert read_member() == b"ID\n2\n"
+
+
+def test_run_loader_parallel_sqlite_merges_deduplicated_tables(tmp_path, capsys):
+    zip_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("TEST.txt", "ID,NAME\n1,Alice\n2,Bob\n1,Alice\n3,Carol\n")
+        zf.writestr("OTHER.txt", "CODE,DESC\nA,One\nB,Two\nB,Again\n")
+
+    import sqlite3
+    conn = sqlite3.connect(str(tmp_path / "main.db"))
+    cursor = conn.cursor()
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
+    cursor.execute('CREATE TABLE "OTHER" ("CODE" TEXT PRIMARY KEY, "DESC" TEXT)')
+
+    config = {"TABLES": {"TEST": ["ID", "NAME"], "OTHER": ["CODE", "DESC"]},
+              "ZIP_PATH": str(zip_path)}
+    args = SimpleNamespace(engine="sqlite", batch_size=5000, workers=2, extract=False, bulk_dir=None)
+    run_loader(config, args, cursor)
+    # Merges commit as they go, but the tail of the load is left for the caller
+    assert conn.in_transaction
+    conn.commit()
+
+    # Counts are reported by the parent, one whole line per table
+    loaded = sorted(line for line in capsys.readouterr().out.splitlines() if "Loaded" in line)
+    assert loaded == ["📦 Loaded 2 rows into other (skipped 1).",
+                      "📦 Loaded 3 rows into test (skipped 1)."]
+
+    cursor.execute('SELECT "ID", "NAME" FROM TEST ORDER BY "ID"')
+    assert cursor.fetchall() == [("1", "Alice"), ("2", "Bob"), ("3", "Carol")]
+    cursor.execute('SELECT "CODE", "DESC" FROM OTHER ORDER BY "CODE"')
+    assert cursor.fetchall() == [("A", "One"), ("B", "Two")]
@@ -0,0 +1,39 @@
+import pytest
+from unittest.mock import patch
+from main import parse_args
+
+
+@pytest.mark.parametrize("batch_size", ["0", "-5"])
+def test_parse_args_rejects_batch_size_below_one(batch_size, capsys):
+    with patch("sys.argv", ["main.py", "--batch-size", batch_size]):
+        with pytest.raises(SystemExit):
+            parse_args()
+    assert "--batch-size must be at least 1" in capsys.readouterr().err
+
+
+def test_parse_args_accepts_batch_size_of_one():
+    with patch("sys.argv", ["main.py", "--batch-size", "1"]):
+        assert parse_args().batch_size == 1
+
+
+def test_importing_main_does_not_load_database_drivers():
+    import os, subprocess, sys
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    code = "import sys, main; print(sorted({'sqlite3', 'pyodbc'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=src,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_parse_args_rejects_bulk_dir_without_sqlserver(capsys):
+    with patch("sys.argv", ["main.py", "--bulk-dir", "staging"]):
+        with pytest.raises(SystemExit):
+            parse_args()
+    assert "--bulk-dir is only supported with --engine sqlserver" in capsys.readouterr().err
+
+
+def test_parse_args_makes_bulk_dir_absolute():
+    import os
+    argv = ["main.py", "--engine", "sqlserver", "--server", "db", "--trusted", "--bulk-dir", "staging"]
+    with patch("sys.argv", argv):
+        assert parse_args().bulk_dir == os.path.abspath("staging")
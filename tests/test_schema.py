@@ -1,4 +1,5 @@
 import io, zipfile, csv
+import pytest
 from loader import load_table_from_zip
 
 def test_load_table_from_zip_inserts_unique_rows(tmp_path):
@@ -14,11 +15,39 @@ def test_load_table_from_zip_inserts_unique_rows(tmp_path):
     import sqlite3
     conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
-    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT, "NAME" TEXT)')
+    cursor.execute('CREATE TABLE "TEST" ("ID" TEXT PRIMARY KEY, "NAME" TEXT)')
 
     # Run loader
     with zipfile.ZipFile(zip_path, "r") as zf:
         load_table_from_zip(zf, table_name, columns, cursor)
 
     cursor.execute("SELECT COUNT(*) FROM TEST")
-    assert cursor.fetchone()[0] == 2  # deduplicated by ID
\ No newline at end of file
+    assert cursor.fetchone()[0] == 2  # deduplicated by ID
+
+def test_split_statements_ignores_quoted_semicolons():
+    from schema import split_statements
+    sql = "INSERT INTO t VALUES ('a;b');\nSELECT [x;y] FROM \"q;r\";\n\n"
+    assert split_statements(sql) == ["INSERT INTO t VALUES ('a;b')", 'SELECT [x;y] FROM "q;r"']
+
+
+def test_split_statements_skips_apostrophes_in_comments():
+    from schema import split_statements
+    sql = "CREATE TABLE t (\n -- owner's name; padded\n a TEXT\n);\nDROP TABLE u;"
+    assert split_statements(sql) == ["CREATE TABLE t (\n -- owner's name; padded\n a TEXT\n)", "DROP TABLE u"]
+    with pytest.raises(ValueError):
+        split_statements("INSERT INTO t VALUES ('a);")
+
+
+def test_initialize_schema_reads_schema_file_once():
+    import sqlite3
+    from unittest.mock import patch
+    import schema
+
+    schema._load_schema.cache_clear()
+    with patch("builtins.open", wraps=open) as opened:
+        for _ in range(2):
+            conn = sqlite3.connect(":memory:")
+            schema.initialize_schema(conn.cursor(), "sqlite")
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            assert {"master", "dereg", "docindex"} <= tables
+    assert opened.call_count == 1